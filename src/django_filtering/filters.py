@@ -1,4 +1,4 @@
-from copy import deepcopy
+from copy import copy
 from typing import Any
 
 from django import forms
@@ -7,7 +7,13 @@ from django.db.models import Field, Model, Q
 
 from .conf import configurator, settings
 from .forms.fields import DateRangeField, PartialDateRangeField
-from .utils import construct_field_lookup_arg, deconstruct_query
+from .utils import construct_field_lookup_arg, construct_field_lookup_name, deconstruct_query
+
+
+try:
+    from django.utils.choices import CallableChoiceIterator
+except ImportError:  # Django < 5.0, where model field choices can't be callable
+    CallableChoiceIterator = ()
 
 
 __all__ = (
@@ -30,6 +36,8 @@ class Lookup:
     the lookup's relationship to a field.
     """
 
+    __slots__ = ('name', 'label')
+
     type = None
 
     def __init__(self, name: str, label: str | None = None):
@@ -46,6 +54,25 @@ class Lookup:
             "label": self.label,
         }
 
+    def has_static_options_schema_definition(self, field=None) -> bool:
+        """
+        Whether ``get_options_schema_definition`` gives the same result on every call
+        for the given field, which allows the result to be reused.
+        Subclasses that customize the definition are assumed to be dynamic,
+        unless they override this method.
+        """
+        return type(self).get_options_schema_definition is Lookup.get_options_schema_definition
+
+    def has_static_transmute(self) -> bool:
+        """
+        Whether ``clean`` and ``transmute`` give the same result on every call
+        for the same criteria and filter, which allows the result to be reused.
+        Subclasses that customize either method are assumed to be dynamic,
+        unless they override this method.
+        """
+        cls = type(self)
+        return cls.clean in _STATIC_LOOKUP_METHODS and cls.transmute in _STATIC_LOOKUP_METHODS
+
     def __repr__(self):
         cls_name = self.__class__.__name__
         return f'<{cls_name} name="{self.name}" type="{self.type}" label="{self.label}">'
@@ -66,18 +93,14 @@ class SingleFieldLookup(Lookup):
     The ``name`` parameter is a valid field lookup (e.g. `icontains`, `exact`).
     """
 
+    __slots__ = ()
+
     def transmute(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
         """
         Produces a ``Q`` object from the query data criteria.
         """
         filter = context['filter']
-        return Q(
-            construct_field_lookup_arg(
-                filter.name,
-                criteria['value'],
-                criteria['lookup'],
-            )
-        )
+        return Q((construct_field_lookup_name(filter.name, criteria['lookup']), criteria['value']))
 
 
 class InputLookup(SingleFieldLookup):
@@ -85,6 +108,8 @@ class InputLookup(SingleFieldLookup):
     Represents an text input type field lookup.
     """
 
+    __slots__ = ()
+
     type = 'input'
 
     def as_form_field(self, filterset_cls, filter) -> forms.Field:
@@ -106,11 +131,17 @@ class ChoiceLookup(SingleFieldLookup):
 
     """
 
+    __slots__ = ('_choices', '_has_callable_choices', '_schema_cache')
+
     type = 'choice'
 
     def __init__(self, *args, choices=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._choices = choices
+        # Resolved once, rather than checking on every use of the choices.
+        self._has_callable_choices = callable(choices)
+        # Memoized options schema choices keyed by model field.
+        self._schema_cache = {}
 
     def __hash__(self):
         return hash(str(super().__hash__()) + str(self._choices))
@@ -127,16 +158,44 @@ class ChoiceLookup(SingleFieldLookup):
             else:
                 return list(field.get_choices(include_blank=include_blank, blank_choice=settings.BLANK_CHOICE))
         else:
-            choices = self._choices(lookup=self, field=field) if callable(self._choices) else self._choices
+            choices = self._choices(lookup=self, field=field) if self._has_callable_choices else self._choices
             if include_blank:
                 choices = settings.BLANK_CHOICE + list(choices)
             return choices
 
+    def _has_static_choices(self, field: Field | None = None) -> bool:
+        """
+        Static choices do not change for the life of the process,
+        which is the case for explicitly listed choices and model field choices.
+        Callable choices (including callable model field choices)
+        and relational choices (i.e. database rows) are dynamic.
+        """
+        if self._choices is None:
+            field_choices = getattr(field, 'choices', None)
+            return field_choices is not None and not isinstance(field_choices, CallableChoiceIterator)
+        return not self._has_callable_choices
+
     def get_options_schema_definition(self, field=None):
         definition = super().get_options_schema_definition(field)
-        definition['choices'] = self._get_choices(field=field, include_blank=False)
+        try:
+            choices = self._schema_cache[field]
+        except KeyError:
+            choices = self._get_choices(field=field, include_blank=False)
+            if self._has_static_choices(field):
+                self._schema_cache[field] = choices
+        # Copied, because the choices may be memoized or given by the developer.
+        definition['choices'] = copy(choices)
         return definition
 
+    def has_static_options_schema_definition(self, field=None) -> bool:
+        if type(self).get_options_schema_definition is not ChoiceLookup.get_options_schema_definition:
+            return False
+        return self._has_static_choices(field)
+
+    def clear_cache(self):
+        """Discard the memoized options schema choices."""
+        self._schema_cache.clear()
+
     def as_form_field(self, filterset_cls, filter) -> forms.Field:
         field_kwargs = {
             'required': False,
@@ -178,6 +237,8 @@ class YesNoChoiceLookup(ChoiceLookup):
 
     """
 
+    __slots__ = ()
+
     type = 'choice'
 
     def __init__(self, *args, **kwargs):
@@ -190,11 +251,7 @@ class YesNoChoiceLookup(ChoiceLookup):
     def __hash__(self):
         return hash(str(super().__hash__()) + str(self._choices))
 
-    def get_options_schema_definition(self, field=None):
-        definition = super().get_options_schema_definition(field)
-        definition['choices'] = self._get_choices(field=field, include_blank=False)
-        # TODO restruct to boolean type
-        return definition
+    # TODO restruct the options schema definition to boolean type
 
     def as_form_field(self, filterset_cls, filter) -> forms.Field:
         field_kwargs = {
@@ -213,6 +270,8 @@ class DateRangeLookup(Lookup):
     Represents inputs for querying between a date range.
     """
 
+    __slots__ = ()
+
     type = 'date-range'
 
     def __init__(self, *args, **kwargs):
@@ -226,7 +285,7 @@ class DateRangeLookup(Lookup):
 
     def transmute(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
         filter = context['filter']
-        return Q((f"{filter.name}__range", criteria['value']))
+        return Q((construct_field_lookup_name(filter.name, self.name), criteria['value']))
 
     def as_form_field(self, filterset_cls, filter) -> forms.Field:
         field_kwargs = {
@@ -244,6 +303,8 @@ class PartialDateRangeLookup(DateRangeLookup):
     This differs from the ``DateRangeLookup`` because it allows for either the start or end value to be left blank.
     """
 
+    __slots__ = ()
+
     type = 'partial-date-range'
 
     # At this time there is no reason to _clean_ the value
@@ -280,6 +341,18 @@ class PartialDateRangeLookup(DateRangeLookup):
         return PartialDateRangeField(**field_kwargs)
 
 
+# The lookup methods of this package that only depend on the criteria and the filter,
+# see ``Lookup.has_static_transmute``.
+_STATIC_LOOKUP_METHODS = frozenset(
+    (
+        Lookup.clean,
+        SingleFieldLookup.transmute,
+        DateRangeLookup.transmute,
+        PartialDateRangeLookup.transmute,
+    )
+)
+
+
 # A sentry value used to signal when the user has selected
 # to remove the sticky filter.
 STICKY_SOLVENT_VALUE = object()
@@ -297,6 +370,22 @@ class Filter:
 
     """
 
+    __slots__ = (
+        '_name',
+        'lookups',
+        'default_lookup',
+        'label',
+        '_transmuter',
+        '_transmute_criteria',
+        'sticky_value',
+        'solvent_value',
+        '_lookups_by_name',
+        '_cleans_values',
+        '_resolved_fields',
+        '_options_schema_lookups',
+        '_sticky_Q',
+    )
+
     _name: str
 
     def __init__(
@@ -312,16 +401,29 @@ class Filter:
         # Ensure at least one lookup has been defined.
         if len(self.lookups) == 0:
             raise ValueError("Must specify at least one lookup for the filter (e.g. InputLookup).")
+        self._lookups_by_name = {lu.name: lu for lu in self.lookups}
+        # Whether any of the lookups changes the value when cleaning, see ``clean``.
+        self._cleans_values = any(type(lu).clean is not Lookup.clean for lu in self.lookups)
         # Assign the default lookup to use or default to the first defined lookup.
         self.default_lookup = default_lookup if default_lookup else self.lookups[0].name
         if label is None:
             raise ValueError("At this time, the filter label must be provided.")
         self.label = label
         self._transmuter = transmuter
+        # The transmute strategy is fixed at creation, so select it once rather than per call.
+        # Stored as a plain function, because a bound method would be carried over to copies.
+        cls = type(self)
+        self._transmute_criteria = cls._transmute_custom if transmuter else cls._transmute_via_lookups
         # Sticky filter properties used to designate the default sticky value
         # and solvent value that removes the sticky value from the resulting query.
         self.sticky_value = sticky_value
         self.solvent_value = solvent_value
+        # Model fields resolved for the options schema, see ``get_options_schema_info``.
+        self._resolved_fields = {}
+        # Static options schema lookup definitions, see ``_get_options_schema_lookups``.
+        self._options_schema_lookups = {}
+        # Memoized sticky ``Q``, see ``get_sticky_Q``.
+        self._sticky_Q = None
 
     def __repr__(self):
         cls_name = self.__class__.__name__
@@ -354,9 +456,15 @@ class Filter:
         """
         Returns a copy of this filter with assignments from the given ``name``,
         which is the name given to the Filter in the FilterSet.
+
+        The copy is shallow, because the lookups and other arguments
+        are not modified after the filter has been created.
         """
-        filter = deepcopy(self)
+        filter = copy(self)
         filter._name = name
+        filter._resolved_fields = {}
+        filter._options_schema_lookups = {}
+        filter._sticky_Q = None
         return filter
 
     @property
@@ -366,10 +474,40 @@ class Filter:
     def get_sticky_Q(self, context: dict[str, Any]) -> Q | None:
         """
         Returns a ``Q`` object with the sticky value
+
+        The ``Q`` is memoized when this filter and its lookup clean and transmute
+        the way this package does, because that only depends on this filter
+        and not on the rest of the context (see ``Lookup.has_static_transmute``).
+        A custom transmuter or customized cleaning could depend on the context
+        (e.g. the queryset) or the time, so it is called every time.
+
+        The memoized ``Q`` is never handed out itself, because combining or adding
+        to the returned ``Q`` would otherwise change it for every later caller.
+        """
+        if self.sticky_value is None:
+            return None
+        q = self._sticky_Q
+        if q is None:
+            q = self.transmute({'value': self.sticky_value}, context=context)
+            cls = type(self)
+            if (
+                q is None
+                or self._transmuter is not None
+                or cls.clean is not Filter.clean
+                or cls.transmute is not Filter.transmute
+                or not self.get_lookup().has_static_transmute()
+            ):
+                return q
+            self._sticky_Q = q
+        # ``create`` copies the list of children.
+        return Q.create(q.children, connector=q.connector, negated=q.negated)
+
+    def clear_sticky_cache(self):
+        """
+        Discard the memoized sticky ``Q``.
+        Call this after changing the ``sticky_value`` at runtime.
         """
-        if self.sticky_value is not None:
-            return self.transmute({'value': self.sticky_value}, context=context)
-        return None
+        self._sticky_Q = None
 
     def resolve_field(
         self,
@@ -420,17 +558,65 @@ class Filter:
 
         return field
 
-    def get_options_schema_info(self, context: dict[str, Any]):
-        info = {"default_lookup": self.default_lookup, "label": self.label}
+    def _resolve_lookup_field(self, context: dict[str, Any], lookup: Lookup) -> tuple[Field | None, Any]:
+        """
+        Memoized ``resolve_field`` for the given lookup,
+        paired with the resolved field's help text (``None`` when blank).
+        The model's fields do not change, so the result is cached
+        on this bound filter by model and lookup name.
+        """
+        model = context['filterset']._meta.model
+        key = (model, lookup.name)
+        try:
+            return self._resolved_fields[key]
+        except KeyError:
+            field = self.resolve_field(context, lookup, model=model)
+            # The help text is kept as is, because it could be a lazy translation.
+            help_text = getattr(field, "help_text", None) or None
+            result = self._resolved_fields[key] = (field, help_text)
+            return result
+
+    def _get_options_schema_lookups(self, context: dict[str, Any]) -> tuple[dict[str, Any], Any, bool]:
+        """
+        Returns the options schema definitions of the lookups,
+        the help text of the filter's field and whether the definitions are memoized.
+        The result is memoized by model when all the definitions are static
+        (see ``Lookup.has_static_options_schema_definition``), so it should not be modified.
+        """
+        model = context['filterset']._meta.model
+        try:
+            return self._options_schema_lookups[model]
+        except KeyError:
+            pass
 
         lookups = {}
+        help_text = None
+        is_static = True
         for lu in self.lookups:
-            field = self.resolve_field(context, lu)
+            field, field_help_text = self._resolve_lookup_field(context, lu)
             lookups[lu.name] = lu.get_options_schema_definition(field)
-            info["lookups"] = lookups
-            if hasattr(field, "help_text") and field.help_text:
-                # Evaluate to string because it could be a lazy object.
-                info['help_text'] = str(field.help_text)
+            is_static = is_static and lu.has_static_options_schema_definition(field)
+            if field_help_text is not None:
+                help_text = field_help_text
+
+        result = (lookups, help_text, is_static)
+        if is_static:
+            self._options_schema_lookups[model] = result
+        return result
+
+    def get_options_schema_info(self, context: dict[str, Any]):
+        info = {"default_lookup": self.default_lookup, "label": self.label}
+
+        lookups, help_text, is_memoized = self._get_options_schema_lookups(context)
+        if is_memoized:
+            # Copy what is shared with the memo, because the schema is handed out.
+            lookups = {
+                name: {**d, 'choices': copy(d['choices'])} if 'choices' in d else dict(d) for name, d in lookups.items()
+            }
+        info["lookups"] = lookups
+        if help_text is not None:
+            # Evaluate to string because it could be a lazy object.
+            info['help_text'] = str(help_text)
 
         if self.is_sticky:
             info['is_sticky'] = True
@@ -441,37 +627,59 @@ class Filter:
     def get_lookup(self, name=None) -> Lookup:
         if name is None:
             name = self.default_lookup
-        return [lu for lu in self.lookups if lu.name == name][0]
+        try:
+            return self._lookups_by_name[name]
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Unknown lookup name: '{name}'") from exc
 
     def clean(self, criteria) -> dict[str, Any]:
         """
         Clean the criteria for database usage.
-        """
-        # Make a copy of the criteria that we will mutate.
-        cleaned = criteria.copy()
 
-        # Defer to the lookup instance for cleaning specifics
-        cleaned['value'] = self.get_lookup(criteria.get('lookup')).clean(criteria['value'])
+        The given criteria are returned as is when cleaning does not change the value,
+        so the result must not be modified.
+        """
+        value = criteria['value']
+        lookup = self.get_lookup(criteria.get('lookup'))
+        # Defer to the lookup instance for cleaning specifics,
+        # unless none of the lookups change the value.
+        cleaned_value = lookup.clean(value) if self._cleans_values else value
 
         # Check if the cleaned value is the solvent that removes the sticky filter.
-        if cleaned['value'] == self.solvent_value:
-            cleaned['value'] = STICKY_SOLVENT_VALUE
-        return cleaned
+        if cleaned_value == self.solvent_value:
+            cleaned_value = STICKY_SOLVENT_VALUE
+
+        if cleaned_value is value:
+            return criteria
+        return {**criteria, 'value': cleaned_value}
 
     def transmute(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
         """
         Produces a ``Q`` object from the query data criteria.
+
+        The criteria are handed to the developer defined ``transmuter``
+        when one was given, otherwise to the transmute method of the criteria's lookup.
         """
-        criteria = self.clean(criteria)
-        if criteria['value'] == STICKY_SOLVENT_VALUE:
+        cleaned = self.clean(criteria)
+        if cleaned['value'] == STICKY_SOLVENT_VALUE:
             # Explicity user selection to remove the sticky filter.
             return None
 
-        # Set the lookup name for the transmuter's convenience.
-        lookup_name = criteria.setdefault('lookup', self.default_lookup)
+        if 'lookup' not in cleaned:
+            # Set the lookup name for the transmuter's convenience.
+            if cleaned is criteria:
+                cleaned = {**criteria, 'lookup': self.default_lookup}
+            else:
+                # Cleaning already made a copy, which is ours to modify.
+                cleaned['lookup'] = self.default_lookup
+
+        return self._transmute_criteria(self, cleaned, context)
+
+    def _transmute_custom(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
+        return self._transmuter(criteria, context=context)
 
-        transmuter = self._transmuter or self.get_lookup(lookup_name).transmute
-        return transmuter(criteria, context=context)
+    def _transmute_via_lookups(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
+        return self.get_lookup(criteria['lookup']).transmute(criteria, context=context)
 
     def as_form_fields(self, filterset_cls) -> dict[str, forms.Field]:
         """
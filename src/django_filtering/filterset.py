@@ -1,4 +1,5 @@
-from collections.abc import Callable
+import json
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Any, Literal
@@ -10,7 +11,7 @@ from django.db.models import Model, Q, QuerySet
 
 from . import filters
 from .filters import Filter
-from .schemas import FilteringOptionsSchema, JSONSchema
+from .schemas import FilteringOptionsSchema, JSONSchema, make_json_schema
 from .utils import model_field_label
 
 
@@ -48,6 +49,37 @@ def default_lookup_factory(lookup_name: str) -> filters.Lookup:
     return filters.InputLookup(lookup_name)
 
 
+# Memoized model field lookups keyed by model, see ``get_model_field_lookups``.
+# This is a plain dict, so a model stays alive for as long as the process does
+# once its lookups are memoized (the cached fields refer back to the model anyway),
+# just as it does in Django's app registry.
+_model_field_lookups_cache = {}
+
+
+def get_model_field_lookups(model) -> tuple[tuple[ModelField, tuple[str, ...]], ...]:
+    """
+    Returns the given model's fields paired with the names of their lookups.
+
+    The result is memoized per model once the app registry is ready,
+    because introspecting the fields and lookups is repeated
+    for every FilterSet defined for the model.
+
+    """
+    try:
+        return _model_field_lookups_cache[model]
+    except KeyError:
+        pass
+
+    opts = model._meta
+    field_lookups = tuple(
+        (field, tuple(field.get_lookups().keys())) for field in opts.get_fields() if field not in opts.private_fields
+    )
+    # Fields are still being contributed to the model until the registry is ready.
+    if opts.apps.ready:
+        _model_field_lookups_cache[model] = field_lookups
+    return field_lookups
+
+
 def filters_for_model(
     model,
     fields: dict[str, list[str]] | Literal[ALL_FIELDS] | None = None,
@@ -69,39 +101,38 @@ def filters_for_model(
 
     """
     field_dict = {}
-    opts = model._meta
-    all_fields = [f for f in opts.get_fields() if f not in opts.private_fields]
 
     if not fields:
         return field_dict
-    elif fields == ALL_FIELDS:
-        fields = {f.name: ALL_LOOKUPS for f in all_fields}
 
-    for field in all_fields:
+    if filter_factory_callback is None:
+        filter_factory_callback = default_filter_factory
+    elif not callable(filter_factory_callback):
+        raise TypeError("filter_factory_callback must be a function or callable")
+    if labels is None:
+        labels = {}
+    is_all_fields = fields == ALL_FIELDS
+    # Local aliases for the loop below, which runs for every field of the model.
+    lookup_factory = default_lookup_factory
+    field_label = model_field_label
+
+    for field, all_lookup_names in get_model_field_lookups(model):
         name = field.name
-        if fields is not None and name not in fields:
-            continue
-
-        kwargs = {}
-
-        lookup_names = fields[field.name]
-        if lookup_names == ALL_LOOKUPS:
-            lookup_names = list(field.get_lookups().keys())
-        kwargs["lookups"] = [default_lookup_factory(lu) for lu in lookup_names]
-
-        if labels and field.name in labels:
-            kwargs["label"] = labels[field.name]
+        if is_all_fields:
+            lookup_names = all_lookup_names
+        elif name in fields:
+            lookup_names = fields[name]
+            if lookup_names == ALL_LOOKUPS:
+                lookup_names = all_lookup_names
         else:
-            kwargs["label"] = model_field_label(field)
+            continue
 
-        if filter_factory_callback is None:
-            filter = default_filter_factory(field, **kwargs)
-        elif not callable(filter_factory_callback):
-            raise TypeError("filter_factory_callback must be a function or callable")
-        else:
-            filter = filter_factory_callback(field, **kwargs)
-        filter = filter.bind(name)
-        field_dict[name] = filter
+        filter = filter_factory_callback(
+            field,
+            lookups=[lookup_factory(lu) for lu in lookup_names],
+            label=labels[name] if name in labels else field_label(field),
+        )
+        field_dict[name] = filter.bind(name)
 
     return field_dict
 
@@ -150,6 +181,9 @@ class Metadata:
 
         # Collect the filters.
         self._filters = kwargs.get('_declared_filters', {})
+        # Memoized names of the FilterSet's ``transmute_*`` methods
+        # keyed by filter name and lookup, see ``FilterSet.call_transmuter``.
+        self.transmuter_method_names = {}
 
         self.fields = kwargs.get('fields', {})
         if self.model:
@@ -198,6 +232,46 @@ class Metadata:
     def get_filter(self, name: str) -> Filter:
         return self.filters[name]
 
+    @cached_property
+    def filter_lookup_names(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """
+        The name of each filter paired with the names of its lookups, in filter order.
+        """
+        return tuple((name, tuple(lu.name for lu in filter.lookups)) for name, filter in self.filters.items())
+
+    @cached_property
+    def json_schema(self) -> dict:
+        """
+        The json-schema for validating the FilterSet's query data.
+        The schema is the same for every FilterSet instance,
+        so it is generated once for the ``json_schema_validator`` and ``json_schema_text``.
+        It must not be modified; ``JSONSchema.schema`` is a private copy.
+        """
+        return make_json_schema(self.model, self.filter_lookup_names)
+
+    @cached_property
+    def json_schema_text(self) -> str:
+        """
+        The ``json_schema`` serialized to JSON, which is also shared.
+        """
+        return json.dumps(self.json_schema)
+
+    @cached_property
+    def json_schema_validator(self) -> jsonschema.protocols.Validator:
+        """
+        The validator for the ``json_schema``.
+        Like the schema, it is created once and shared by every FilterSet instance.
+        """
+        schema = self.json_schema
+        cls = jsonschema.validators.validator_for(schema)
+        if settings.DEBUG:
+            try:
+                cls.check_schema(schema)
+            except jsonschema.SchemaError as exc:
+                raise RuntimeError("The generated schema is invalid. This is a bug.") from exc
+
+        return cls(schema)
+
     @property
     def sticky_filters(self) -> dict[str, Filter]:
         return {k: v for k, v in self.filters.items() if v.is_sticky}
@@ -249,21 +323,44 @@ class InvalidFilterSet(Exception):
 
 
 class FilterSet(metaclass=FilterSetType):
-    valid_connectors = (
-        Q.AND,
-        Q.OR,
+    valid_connectors = frozenset(
+        (
+            Q.AND,
+            Q.OR,
+        )
     )
 
     def __init__(self, query_data=None):
         self.query_data = [] if query_data is None else query_data
         # Initialize the errors state, to be called by is_valid()
         self._errors = None
-        # Create the json-schema for validation
-        # Note, this is a public variable because it can be made public for frontend validation.
-        self.json_schema = JSONSchema(self)
-        # Create the filtering options schema
-        # to provide the frontend with the available filtering options.
-        self.filtering_options_schema = FilteringOptionsSchema(self)
+
+    @classmethod
+    def from_validated(cls, query_data) -> 'FilterSet':
+        """
+        Create a FilterSet from query data that has already been validated
+        against this FilterSet's json-schema (e.g. stored after an earlier validation).
+        The json-schema validation is skipped.
+        """
+        filterset = cls(query_data)
+        filterset._errors = []
+        return filterset
+
+    @cached_property
+    def json_schema(self) -> JSONSchema:
+        """
+        The json-schema for validation.
+        Note, this is public because it can be made public for frontend validation.
+        """
+        return JSONSchema(self)
+
+    @cached_property
+    def filtering_options_schema(self) -> FilteringOptionsSchema:
+        """
+        The filtering options schema
+        to provide the frontend with the available filtering options.
+        """
+        return FilteringOptionsSchema(self)
 
     def get_default_queryset(self):
         return self._meta.model.objects.all()
@@ -298,6 +395,14 @@ class FilterSet(metaclass=FilterSetType):
             queryset = queryset.filter(query)
         return queryset
 
+    def iter_queryset(self, queryset=None, chunk_size: int = 2000) -> Iterator[Model]:
+        """
+        Iterate over the results of ``filter_queryset`` in chunks of ``chunk_size`` rows
+        (see ``QuerySet.iterator``), rather than loading every row at once.
+        The results are not cached on the queryset, so they can only be iterated once.
+        """
+        return self.filter_queryset(queryset).iterator(chunk_size=chunk_size)
+
     @property
     def is_valid(self) -> bool:
         """Property used to check trigger and check validation."""
@@ -310,17 +415,6 @@ class FilterSet(metaclass=FilterSetType):
         """A list of validation errors. This value is populated when there are validation errors."""
         return self._errors
 
-    def _make_json_schema_validator(self, schema):
-        cls = jsonschema.validators.validator_for(schema)
-        cls.check_schema(schema)  # XXX
-        if settings.DEBUG:
-            try:
-                cls.check_schema(schema)
-            except jsonschema.SchemaError as exc:
-                raise RuntimeError("The generated schema is invalid. This is a bug.") from exc
-
-        return cls(schema)
-
     def validate(self) -> None:
         """
         Check the given query data contains valid syntax, fields and lookups.
@@ -330,19 +424,16 @@ class FilterSet(metaclass=FilterSetType):
 
         Use the ``is_valid`` property to call this method.
         """
-        self._errors = []
-
-        # Validates both the schema and the data
-        validator = self._make_json_schema_validator(self.json_schema.schema)
-        for err in validator.iter_errors(self.query_data):
-            # TODO We can provide better detail than simply echoing
-            #      the exception details. See jsonschema.exceptions.best_match.
-            self._errors.append(
-                {
-                    'json_path': err.json_path,
-                    'message': err.message,
-                }
-            )
+        validator = self._meta.json_schema_validator
+        # TODO We can provide better detail than simply echoing
+        #      the exception details. See jsonschema.exceptions.best_match.
+        self._errors = [
+            {
+                'json_path': err.json_path,
+                'message': err.message,
+            }
+            for err in validator.iter_errors(self.query_data)
+        ]
 
     @property
     def has_query_data(self) -> bool:
@@ -367,37 +458,58 @@ class FilterSet(metaclass=FilterSetType):
             'filter': filter,
         }
 
-    def _transmute(self, query_data: None | list, queryset: QuerySet, _is_root: bool = True) -> Q | None:
+    def _transmute(self, query_data: None | list, queryset: QuerySet) -> Q | None:
         """
         Transmute the given query data to a ``Q`` object.
+
+        The query tree is walked with an explicit stack rather than recursion,
+        so deeply nested query data does not pay for a Python frame per grouping
+        or run into the recursion limit.
         """
         if not query_data:
             return None
 
-        key, value = query_data
-
-        is_negated = False
-        if key.upper() == "NOT":
-            is_negated = True
-            # Unwrap the negated grouping
-            key, value = value
-
-        if key.upper() in self.valid_connectors:
-            connector = key.upper()
-            q = Q.create(connector=connector)
-            # Recurively build query tree
-            for v in value:
-                q_child = self._transmute(v, queryset=queryset, _is_root=False)
-                if not q_child:
-                    continue
-                q = q._combine(q_child, connector)
-            q.negated = is_negated
-        else:
-            context = self.make_context(filter=self.get_filter(key), queryset=queryset)
-            q = self.call_transmuter(value, context)
-            if q and (_is_root or is_negated):
-                q = Q.create(q.children, negated=is_negated)
-        return q
+        # Stack of the groupings being built,
+        # where each frame is ``[q, connector, is_negated, remaining_children]``.
+        stack = []
+        valid_connectors = self.valid_connectors
+        node, is_root = query_data, True
+        while True:
+            key, value = node
+            operator = key.upper()
+
+            is_negated = False
+            if operator == "NOT":
+                is_negated = True
+                # Unwrap the negated grouping
+                key, value = value
+                operator = key.upper()
+
+            if operator in valid_connectors:
+                # Descend into the grouping's children
+                stack.append([Q.create(connector=operator), operator, is_negated, iter(value)])
+                q = None
+            else:
+                context = self.make_context(filter=self.get_filter(key), queryset=queryset)
+                q = self.call_transmuter(value, context)
+                if q and (is_root or is_negated):
+                    q = Q.create(q.children, negated=is_negated)
+
+            # Combine the result with its grouping and move on to the next child,
+            # completing each grouping that has no remaining children.
+            while stack:
+                frame = stack[-1]
+                if q:
+                    frame[0] = frame[0]._combine(q, frame[1])
+                node = next((v for v in frame[3] if v), None)
+                if node is not None:
+                    is_root = False
+                    break
+                stack.pop()
+                q = frame[0]
+                q.negated = frame[2]
+            else:
+                return q
 
     def call_transmuter(self, criteria: dict[str, Any], context: dict[str, Any]) -> Q | None:
         """
@@ -410,6 +522,8 @@ class FilterSet(metaclass=FilterSetType):
         name the method: `transmute_<filter>__<lookup...>`.
         These transmuter methods are intended to provide the developer with
         an easy way to override the default transmute logic of the filter.
+        The methods are looked up on the class, not the instance,
+        so a transmuter assigned to a FilterSet instance is not used.
         """
         # FIXME The lookup is optional, but we don't have a fully formed case where
         #       the default lookup information is not available.
@@ -418,14 +532,31 @@ class FilterSet(metaclass=FilterSetType):
             lookup = '__'.join(lookup)
 
         filter = context['filter']
-        funcs = [
-            getattr(self, f"transmute_{filter.name}__{lookup}", None),
-            getattr(self, f"transmute_{filter.name}", None),
-            filter.transmute,
-        ]
-        transmuter = [f for f in funcs if f is not None][0]
+        key = (filter.name, lookup)
+        try:
+            method_name = self._meta.transmuter_method_names[key]
+        except KeyError:
+            method_name = self._get_transmuter_method_name(*key)
+            # Only the filter's own lookups are memoized, so the names of unknown lookups
+            # given in unvalidated query data (e.g. ``from_validated``) are not retained.
+            if lookup in filter._lookups_by_name:
+                self._meta.transmuter_method_names[key] = method_name
+
+        transmuter = filter.transmute if method_name is None else getattr(self, method_name)
         return transmuter(criteria, context=context)
 
+    @classmethod
+    def _get_transmuter_method_name(cls, filter_name: str, lookup: str) -> str | None:
+        """
+        Returns the name of the most specific transmuter method
+        defined for the given filter and lookup, if any.
+        A method set to ``None`` (e.g. to disable an inherited method) is ignored.
+        """
+        for name in (f"transmute_{filter_name}__{lookup}", f"transmute_{filter_name}"):
+            if getattr(cls, name, None) is not None:
+                return name
+        return None
+
     def _apply_sticky_filters(self, q, queryset):
         """
         Apply sticky filters to the query filters.
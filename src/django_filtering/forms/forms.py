@@ -173,7 +173,7 @@ class FlatFilteringForm(forms.Form):
                 self.initial[field_name] = value
 
             # Reverse sticky filters using the sticky fields
-            condition_field_names = [self.__get_field_name_and_value(x)[0] for x in conditions]
+            condition_field_names = {self.__get_field_name_and_value(x)[0] for x in conditions}
             for field_name in self.Meta.sticky_fields:
                 if field_name not in condition_field_names:
                     filter = self.__get_filter_by_field_name(field_name)
@@ -246,28 +246,27 @@ class FlatFilteringForm(forms.Form):
         if not self.filterset.has_query_data:
             self.filterset.query_data = ['and', []]
 
+        sticky_fields = set(self.Meta.sticky_fields)
         for field_name in self.changed_data:
             value = self.cleaned_data[field_name]
             conditions = self.filterset.query_data[1]
-            condition_field_names = [self.__get_field_name_and_value(x)[0] for x in conditions]
-
-            is_dropped_field = (
-                field_name in condition_field_names
-                and self.cleaned_data[field_name] in self.fields[field_name].empty_values
-            )
-            is_sticky_field_with_default_value = (
-                field_name in self.Meta.sticky_fields and field_name in condition_field_names
-            )
+            # Position of the first condition for each field name.
+            condition_indexes = {}
+            for i, condition in enumerate(conditions):
+                condition_indexes.setdefault(self.__get_field_name_and_value(condition)[0], i)
+            idx = condition_indexes.get(field_name)
+
+            is_dropped_field = idx is not None and value in self.fields[field_name].empty_values
+            is_sticky_field_with_default_value = field_name in sticky_fields and idx is not None
             if is_dropped_field or is_sticky_field_with_default_value:
-                del self.filterset.query_data[1][condition_field_names.index(field_name)]
+                del conditions[idx]
                 continue
 
             # Insert or update field in query data.
             field_as_q_value = self.__deconstruct_field_data(field_name, value)
-            if field_name not in condition_field_names:
+            if idx is None:
                 conditions.append(field_as_q_value)
             else:
-                idx = condition_field_names.index(field_name)
                 conditions[idx] = field_as_q_value
 
         # Check if the query data has any conditions.
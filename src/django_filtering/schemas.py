@@ -1,29 +1,48 @@
 import json
+from functools import cached_property
 
 
 class FilteringOptionsSchema:
     def __init__(self, filterset):
         self.filterset = filterset
 
-    def _get_field(self, field_name):
-        return self.filterset._meta.model._meta.get_field(field_name)
-
-    @property
-    def schema(self):
-        operators = {
+    def _get_operators(self):
+        return {
             "and": {"type": "operator", "label": "All of..."},
             "or": {"type": "operator", "label": "Any of..."},
             "not": {"type": "operator", "label": "None of..."},
         }
-        filters = {
-            f.name: f.get_options_schema_info(context=self.filterset.make_context(filter=f))
-            for f in self.filterset.filters
-        }
+
+    def iter_filters(self):
+        """
+        Yields the ``(name, info)`` pair of each filter in the schema.
+        """
+        for f in self.filterset.filters:
+            yield f.name, f.get_options_schema_info(context=self.filterset.make_context(filter=f))
+
+    @cached_property
+    def schema(self):
+        # Evaluated on first access and reused for the life of this instance,
+        # because the choices and sticky defaults are costly to produce.
         return {
-            'operators': operators,
-            'filters': filters,
+            'operators': self._get_operators(),
+            'filters': dict(self.iter_filters()),
         }
 
+    def iter_json(self):
+        """
+        Yields the schema serialized to JSON in chunks, one filter at a time.
+        Use this to stream a large schema (e.g. ``StreamingHttpResponse``)
+        without holding the complete schema in memory.
+        The joined chunks are equal to ``str(self)``.
+        """
+        yield f'{{"operators": {json.dumps(self._get_operators())}, "filters": {{'
+        separator = ''
+        for name, info in self.iter_filters():
+            yield f'{separator}{json.dumps(name)}: {json.dumps(info)}'
+            separator = ', '
+        yield '}}'
+
     def __str__(self):
         return json.dumps(self.schema)
 
@@ -61,52 +80,82 @@ BASE_DEFINITIONS = {
 }
 
 
+def make_json_schema(model, filter_lookup_names) -> dict:
+    """
+    Generate the json-schema for validating the query data of the given model's filters.
+    The filters are given as pairs of filter name and lookup names.
+    """
+    model_name = model._meta.model_name.title()
+    # Definitions of each filter for the `$defs` portion of the schema
+    filter_definitions = {}
+    # References to all defined fields to produce the `#/$defs/filters` definition
+    refs = []
+    for filter_name, lookup_names in filter_lookup_names:
+        name = f"{filter_name}-filter"
+        refs.append({'$ref': f"#/$defs/{name}"})
+        filter_definitions[name] = {
+            "type": "array",
+            "prefixItems": [
+                {"const": filter_name},
+                {
+                    "type": "object",
+                    "properties": {
+                        "lookup": {"enum": list(lookup_names)},
+                        # TODO Restrict value types to desired input type.
+                        "value": {
+                            "type": [
+                                "string",
+                                "number",
+                                "object",
+                                "array",
+                                "boolean",
+                                "null",
+                            ]
+                        },
+                    },
+                },
+            ],
+        }
+    # Defines the `$defs` portion of the schema
+    definitions = {**BASE_DEFINITIONS, **filter_definitions, 'filters': {'anyOf': refs}}
+    schema = {
+        "$id": f"https://example.com/{model_name}.json",  # TODO Provide serving url
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "title": f"{model_name} Schema",
+        "$ref": "#/$defs/and-or-op",
+        "$defs": definitions,
+    }
+    return schema
+
+
 class JSONSchema:
     def __init__(self, filterset):
         self.filterset = filterset
 
-    @property
+    @cached_property
     def schema(self):
-        model_name = self.filterset._meta.model._meta.model_name.title()
-        # Defines the `$defs` portion of the schema
-        definitions = BASE_DEFINITIONS.copy()
-        # Listing of all defined fields to produce the `#/$defs/filters` definition
-        fields = []
-        for filter in self.filterset.filters:
-            name = f"{filter.name}-filter"
-            fields.append(name)
-            definitions[name] = {
-                "type": "array",
-                "prefixItems": [
-                    {"const": filter.name},
-                    {
-                        "type": "object",
-                        "properties": {
-                            "lookup": {"enum": [lu.name for lu in filter.lookups]},
-                            # TODO Restrict value types to desired input type.
-                            "value": {
-                                "type": [
-                                    "string",
-                                    "number",
-                                    "object",
-                                    "array",
-                                    "boolean",
-                                    "null",
-                                ]
-                            },
-                        },
-                    },
-                ],
-            }
-        definitions['filters'] = {'anyOf': [{'$ref': f"#/$defs/{n}"} for n in fields]}
-        schema = {
-            "$id": f"https://example.com/{model_name}.json",  # TODO Provide serving url
-            "$schema": "https://json-schema.org/draft/2020-12/schema",
-            "title": f"{model_name} Schema",
-            "$ref": "#/$defs/and-or-op",
-            "$defs": definitions,
-        }
-        return schema
+        # The per-class schema (see ``Metadata.json_schema``) is used by the validator,
+        # so this instance generates its own, which is cheaper than copying it.
+        meta = self.filterset._meta
+        return make_json_schema(meta.model, meta.filter_lookup_names)
+
+    @property
+    def validator(self):
+        """
+        The validator for this schema, which is shared by every instance of the FilterSet class.
+        """
+        return self.filterset._meta.json_schema_validator
+
+    def validate(self, instance) -> None:
+        """
+        Validate the given query data against this schema.
+        Raises ``jsonschema.ValidationError`` when the query data is invalid.
+        """
+        self.validator.validate(instance)
 
     def __str__(self):
+        # Reuse the per-class serialization, unless this instance has its own copy
+        # of the schema, which could have been changed.
+        if 'schema' not in self.__dict__:
+            return self.filterset._meta.json_schema_text
         return json.dumps(self.schema)
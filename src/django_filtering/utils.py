@@ -1,3 +1,5 @@
+import sys
+from functools import lru_cache
 from typing import Any
 
 from django.db.models import Field, Q
@@ -9,21 +11,51 @@ QArg = tuple[str, Any]
 QueryDataVar = list[str | dict[str, Any]]
 
 
+@lru_cache(maxsize=2048)
+def _name_str(field_name: str, lookup: str | None) -> str:
+    """
+    Field lookup name for a single lookup string (e.g. ``'gte'``).
+    """
+    # Interned because the name is used as a keyword argument in the ORM.
+    return sys.intern(field_name + '__' + lookup if lookup else field_name)
+
+
+@lru_cache(maxsize=1024)
+def _name_seq(field_name: str, lookups: tuple[str, ...]) -> str:
+    """
+    Field lookup name for a multi-part lookup (e.g. ``('year', 'gte')``).
+    """
+    return sys.intern('__'.join((field_name, *lookups)))
+
+
 def construct_field_lookup_name(
     field_name: str,
-    lookup: str | None = None,
+    lookup: str | list[str] | None = None,
 ) -> str:
     """
     Given a field name and lookup, produce a valid argument query filter argument name.
+
+    Filters use a small, fixed set of field and lookup pairs,
+    so the names are memoized.
     """
-    lookup_expr = '__'.join(['', lookup]) if lookup else ''
-    return f"{field_name}{lookup_expr}"
+    if lookup is None:
+        return field_name
+    # A single lookup string is the common case, so check for it before sequences.
+    if type(lookup) is str:
+        return _name_str(field_name, lookup)
+    if isinstance(lookup, str):
+        # A str subclass (e.g. an enum member) is reduced to its plain string value.
+        return _name_str(field_name, str.__str__(lookup))
+    if isinstance(lookup, (list, tuple)):
+        # Lists are unhashable, so they can't be used as a cache key.
+        return _name_seq(field_name, tuple(lookup))
+    return _name_str(field_name, lookup)
 
 
 def construct_field_lookup_arg(
     field_name: str,
     value: Any | None = None,
-    lookup: str | None = None,
+    lookup: str | list[str] | None = None,
 ) -> QArg:
     """
     Given a __query data__ structure make a field lookup value
@@ -32,6 +64,12 @@ def construct_field_lookup_arg(
     return (construct_field_lookup_name(field_name, lookup=lookup), value)
 
 
+@lru_cache(maxsize=4096)
+def _split_field_lookup_name(field_lookup: str) -> tuple[str, str]:
+    name, sep, lookup = field_lookup.partition("__")
+    return name, lookup if sep else 'exact'
+
+
 def deconstruct_query(
     query: Q,
 ) -> QueryDataVar:
@@ -42,9 +80,7 @@ def deconstruct_query(
     if len(query.children) >= 2:
         raise ValueError("Can only handle deconstruction of a single query value")
     field_lookup, value = query.children[0]
-    split_info = field_lookup.split("__", 1)
-    name = split_info.pop(0)
-    lookup = 'exact' if len(split_info) == 0 else split_info.pop()
+    name, lookup = _split_field_lookup_name(field_lookup)
     opts = {'value': value, 'lookup': lookup}
     return [name, opts]
 
@@ -52,12 +88,10 @@ def deconstruct_query(
 def merge_dicts(*args):
     if len(args) <= 1:
         return args[0] if len(args) else {}
-    a, b, *args = args
-    merger = {**a, **b}
-    if len(args) == 0:
-        return merger
-    else:
-        return merge_dicts(merger, *args)
+    merger = {}
+    for d in args:
+        merger.update(d)
+    return merger
 
 
 def model_field_label(field: Field) -> str:
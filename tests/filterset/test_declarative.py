@@ -1,3 +1,5 @@
+from unittest import mock
+
 from django.db import models
 
 from django_filtering import filters
@@ -5,6 +7,7 @@ from django_filtering.filterset import (
     ALL_FIELDS,
     FilterSet,
     filters_for_model,
+    get_model_field_lookups,
 )
 from tests.lab_app.models import Participant
 
@@ -24,6 +27,22 @@ class TestFiltersForModel:
         filters_map = filters_for_model(Thing, fields=None)
         assert filters_map == {}
 
+    def test_model_field_lookups_are_memoized(self):
+        class Widget(models.Model):
+            name = models.CharField(max_length=20)
+
+            class Meta:
+                app_label = 'faux_app'
+
+        with mock.patch.object(Widget._meta, 'get_fields', wraps=Widget._meta.get_fields) as get_fields:
+            filters_for_model(Widget, fields=ALL_FIELDS)
+            filters_map = filters_for_model(Widget, fields={'name': ['exact']})
+            assert get_fields.call_count == 1
+
+        assert list(filters_map) == ['name']
+        field_lookups = {f.name: lookups for f, lookups in get_model_field_lookups(Widget)}
+        assert field_lookups['name'] == tuple(Widget._meta.get_field('name').get_lookups().keys())
+
     def test_all_fields(self):
         """
         Test for the creation of filters for all fields on a model.
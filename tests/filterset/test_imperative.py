@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 from django.db.models.query_utils import Q
 from model_bakery import baker
@@ -122,6 +124,10 @@ class TestFilterSetCreation:
         # Check for the expected filters and lookups
         filterset = ParticipantFilterSet()
         assert get_filter_lookup_mapping(filterset) == expected_filters
+        assert ParticipantFilterSet._meta.filter_lookup_names == (
+            ('age', tuple(expected_filters['age'])),
+            ('name', tuple(expected_filters['name'])),
+        )
 
     def test_subclasses_inherits_order(self):
         """
@@ -230,6 +236,16 @@ class TestFilterQuerySet:
         # Check queryset equality
         asserts.assertQuerySetEqual(qs, expected_qs)
 
+    def test_iter_queryset(self):
+        query_data = ['and', [["name", {"lookup": "icontains", "value": "ni"}]]]
+        filterset = ParticipantFilterSet(query_data)
+
+        # Target
+        results = filterset.iter_queryset(Participant.objects.order_by('name'), chunk_size=1)
+
+        assert not isinstance(results, list)
+        assert list(results) == list(Participant.objects.filter(name__icontains="ni").order_by('name'))
+
     def test_filter_queryset__with_given_queryset(self):
         filterset = ParticipantFilterSet()
         # Target
@@ -361,6 +377,19 @@ class TestFilterSetTransmutesQueryData:
         expected = Q(("category__exact", "Kitchen"), _connector=Q.AND)
         assert q == expected
 
+    def test_sticky_filters__query_changes_do_not_persist(self):
+        """
+        Test that changing a query with a memoized sticky filter
+        does not change the query of later instances.
+        """
+        q = KitchenProductFilterSet().get_query(queryset=None)
+
+        # Target
+        q.add(Q(name__icontains="evil"), Q.AND)
+
+        q = KitchenProductFilterSet().get_query(queryset=None)
+        assert q == Q(("category__exact", "Kitchen"), _connector=Q.AND)
+
     def test_sticky_filters__missing_from_query_data(self):
         """
         Test when a sticky filter is not present in the user provided query data.
@@ -549,13 +578,49 @@ class TestFilterSetTransmutesQueryData:
         q = filterset._transmute(filterset.query_data, queryset=None)
 
         # Incomplete list of ISO 1366-1 alpha-3 country codes for North America
-        expected_country_codes = ['CAN', 'MEX', 'USA', 'BMU', 'GRL']
+        expected_country_codes = ('CAN', 'MEX', 'USA', 'BMU', 'GRL')
         expected = Q(
             ("name__icontains", "Fluoride"),
             ("country__in", expected_country_codes),
             _connector=Q.AND,
         )
         assert q == expected
+        # Expect the transmuter method to be looked up once per filter and lookup
+        assert StudyFilterSet._meta.transmuter_method_names[('continent', 'exact')] == 'transmute_continent'
+        assert StudyFilterSet._meta.transmuter_method_names[('name', 'icontains')] is None
+
+    def test_custom_translator__disabled_by_subclass(self):
+        class ContinentStudyFilterSet(StudyFilterSet):
+            transmute_continent = None
+
+        query_data = ["and", [["continent", {"lookup": "exact", "value": "NA"}]]]
+        filterset = ContinentStudyFilterSet(query_data)
+
+        # Target
+        q = filterset._transmute(filterset.query_data, queryset=None)
+
+        # Expect the filter's own transmute to be used
+        assert q == Q(("continent__exact", "NA"), _connector=Q.AND)
+
+    def test_custom_translator__unknown_lookup_is_not_memoized(self):
+        query_data = ["and", [["name", {"lookup": "bogus", "value": "Fluoride"}]]]
+        # Skips the validation that would otherwise reject the unknown lookup.
+        filterset = StudyFilterSet.from_validated(query_data)
+
+        # Target
+        with pytest.raises(ValueError, match="Unknown lookup name: 'bogus'"):
+            filterset._transmute(filterset.query_data, queryset=None)
+
+        # Expect the client given lookup not to be retained
+        assert ('name', 'bogus') not in StudyFilterSet._meta.transmuter_method_names
+
+    def test_nesting_beyond_recursion_limit(self):
+        data = ("name", {"lookup": "icontains", "value": "stove"})
+        for _ in range(sys.getrecursionlimit() + 1):
+            data = ("and", (data,))
+        filterset = ProductFilterSet(data)
+        q = filterset._transmute(filterset.query_data, queryset=None)
+        assert q == Q(name__icontains="stove")
 
 
 class TestFilterSetQueryData:
@@ -580,6 +645,29 @@ class TestFilterSetQueryData:
         expected = Q(("name__icontains", "har"), _connector=Q.AND)
         assert filterset.get_query(queryset=None) == expected
 
+    def test_from_validated(self):
+        data = ["and", [["name", {"lookup": "icontains", "value": "har"}]]]
+
+        # Target
+        filterset = ParticipantFilterSet.from_validated(data)
+
+        assert filterset.errors == []
+        assert filterset.is_valid
+        expected = Q(("name__icontains", "har"), _connector=Q.AND)
+        assert filterset.get_query(queryset=None) == expected
+
+    def test_validator_is_shared(self):
+        """Expect the json-schema validator to be created once per FilterSet class."""
+        data = ["and", [["name", {"lookup": "icontains", "value": "har"}]]]
+        filtersets = [ParticipantFilterSet(data), ParticipantFilterSet(["and", [["name", {"lookup": "exact"}]]])]
+
+        # Target
+        assert filtersets[0].is_valid
+        assert not filtersets[1].is_valid
+
+        assert filtersets[0]._meta.json_schema_validator is filtersets[1]._meta.json_schema_validator
+        assert ParticipantFilterSet._meta.json_schema_validator is not StudyFilterSet._meta.json_schema_validator
+
     def test_invalid_toplevel_operator(self):
         data = [
             "meh",
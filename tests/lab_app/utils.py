@@ -1,4 +1,4 @@
-CONTINENT_CHOICES = [
+CONTINENT_CHOICES = (
     ('AS', 'Asia'),
     ('AF', 'Africa'),
     ('NA', 'North America'),
@@ -6,15 +6,15 @@ CONTINENT_CHOICES = [
     ('AN', 'Antarctica'),
     ('EU', 'Europe'),
     ('AU', 'Australia'),
-]
+)
 
 CONTINENT_COUNTRIES_MAP = {
     # An incomplete list of ISO 3166-1 alpha-3 country codes for North America
-    'NA': ['CAN', 'MEX', 'USA', 'BMU', 'GRL']
+    'NA': ('CAN', 'MEX', 'USA', 'BMU', 'GRL'),
 }
 
 
-def continent_to_countries(value) -> list[str]:
+def continent_to_countries(value) -> tuple[str, ...]:
     if value != 'NA':
         raise Exception("Testing scope is limited to the 'NA' choice.")
     return CONTINENT_COUNTRIES_MAP[value]
@@ -1,12 +1,14 @@
 import datetime
 from unittest import mock
 
+import django
 import pytest
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from model_bakery import baker
 
 from django_filtering import filters
+from django_filtering.utils import construct_field_lookup_name
 
 
 class TestInputLookup:
@@ -122,6 +124,54 @@ class TestChoiceLookup:
         }
         assert options_schema_blurb == expected
 
+    def test_static_choices_are_memoized(self):
+        class Type(models.TextChoices):
+            MANUAL = 'manual', 'Manual'
+            BULK = 'bulk', 'Bulk'
+
+        field = models.CharField(name='type', choices=Type.choices, default=Type.MANUAL)
+        lookup = filters.ChoiceLookup('exact', label='is')
+
+        with mock.patch.object(field, 'get_choices', wraps=field.get_choices) as get_choices:
+            first = lookup.get_options_schema_definition(field)
+            second = lookup.get_options_schema_definition(field)
+            assert get_choices.call_count == 1
+            assert first == second
+            assert first is not second
+            # Expect the memoized choices not to be modified through the definition
+            first['choices'].append(('hacked', 'Hacked'))
+            assert lookup.get_options_schema_definition(field)['choices'] == [('manual', 'Manual'), ('bulk', 'Bulk')]
+
+            # Check the cache can be explicitly discarded
+            lookup.clear_cache()
+            lookup.get_options_schema_definition(field)
+            assert get_choices.call_count == 2
+
+    def test_dynamic_choices_are_not_memoized(self):
+        target_field = models.CharField(name='type')
+        dynamic_choices = mock.Mock(return_value=[('any', 'Any')])
+
+        # Target
+        lookup = filters.ChoiceLookup('exact', label='is', choices=dynamic_choices)
+
+        lookup.get_options_schema_definition(target_field)
+        lookup.get_options_schema_definition(target_field)
+        assert dynamic_choices.call_count == 2
+
+    @pytest.mark.skipif(django.VERSION < (5, 0), reason="callable model field choices require Django 5.0")
+    def test_callable_field_choices_are_not_memoized(self):
+        field_choices = mock.Mock(return_value=[('any', 'Any')])
+        field = models.CharField(name='type', choices=field_choices)
+        lookup = filters.ChoiceLookup('exact', label='is')
+
+        # Target
+        lookup.get_options_schema_definition(field)
+        field_choices.return_value = [('any', 'Any'), ('new', 'New')]
+        definition = lookup.get_options_schema_definition(field)
+
+        assert definition['choices'] == [('any', 'Any'), ('new', 'New')]
+        assert not lookup.has_static_options_schema_definition(field)
+
     def test_transmute(self):
         lookup_name = 'gte'
         label = ">="
@@ -183,7 +233,10 @@ class TestDateRangeLookup:
                 ),
             )
         )
-        assert lookup.transmute(cleaned_criteria, context={'filter': filter}) == expected
+        q = lookup.transmute(cleaned_criteria, context={'filter': filter})
+        assert q == expected
+        # Expect the shared field lookup name to be used
+        assert q.children[0][0] is construct_field_lookup_name(filter.name, lookup_name)
 
     @pytest.mark.skip(reason="not yet implemented")
     def test_validation(self):
@@ -353,6 +406,56 @@ class TestFilter:
         # Expect first lookup to be the default
         assert filter.default_lookup == 'iexact'
 
+    def test_bind(self):
+        lookup = filters.InputLookup('icontains', label='contains')
+        filter = filters.Filter(lookup, label='Name')
+
+        # Target
+        bound_filter = filter.bind('name')
+
+        assert bound_filter is not filter
+        assert bound_filter.name == 'name'
+        assert bound_filter.lookups == (lookup,)
+        # Expect the unbound filter to be left untouched
+        assert not hasattr(filter, '_name')
+        # Expect each binding to be independent of the others
+        assert filter.bind('title').name == 'title'
+        assert bound_filter.name == 'name'
+
+    def test_instances_use_slots(self):
+        lookups = [
+            filters.InputLookup('icontains', label='contains'),
+            filters.ChoiceLookup('exact', label='is', choices=[('a', 'A')]),
+            filters.YesNoChoiceLookup(),
+            filters.DateRangeLookup(label='between'),
+            filters.PartialDateRangeLookup(label='between'),
+        ]
+        filter = filters.Filter(*lookups, label='Name').bind('name')
+
+        # Expect no per-instance __dict__ on the library classes
+        for obj in [filter, *lookups]:
+            assert not hasattr(obj, '__dict__'), obj
+
+        # Expect developer subclasses to still allow arbitrary attributes
+        class CustomLookup(filters.InputLookup):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.extra = True
+
+        assert CustomLookup('exact').extra
+
+    def test_get_lookup(self):
+        exact = filters.InputLookup('exact', label='matches')
+        icontains = filters.InputLookup('icontains', label='contains')
+        filter = filters.Filter(exact, icontains, label='name')
+
+        assert filter.get_lookup('icontains') is icontains
+        # Without a name, expect the default lookup
+        assert filter.get_lookup() is exact
+
+        with pytest.raises(ValueError, match="Unknown lookup name: 'gte'"):
+            filter.get_lookup('gte')
+
     def test_get_options_schema_info(self):
         filter_field_name = 'page_count'
         field = models.IntegerField()
@@ -388,6 +491,107 @@ class TestFilter:
         }
         assert options_schema_info == expected
 
+    def test_get_options_schema_info__memoizes_field_resolution(self):
+        field = models.IntegerField()
+        filter = filters.Filter(
+            filters.InputLookup('gte', label='>='),
+            filters.InputLookup('lte', label='<='),
+            label="Pages",
+        )
+        filterset = mock.MagicMock()
+        filterset._meta.model._meta.get_field.return_value = field
+        filter = filter.bind('page_count')
+
+        # Target
+        context = {'filterset': filterset, 'filter': filter, 'queryset': None}
+        first = filter.get_options_schema_info(context)
+        second = filter.get_options_schema_info(context)
+
+        assert first == second
+        # Expect one resolution per lookup
+        assert filterset._meta.model._meta.get_field.call_count == 2
+        # Expect a new binding to resolve its fields anew
+        assert filter.bind('pages')._resolved_fields == {}
+
+    def test_get_options_schema_info__memoizes_static_lookups(self):
+        field = models.IntegerField()
+        choices = mock.Mock(return_value=[(1, 'One')])
+        static_filter = filters.Filter(
+            filters.InputLookup('gte', label='>='),
+            filters.ChoiceLookup('exact', label='is', choices=[(1, 'One')]),
+            label="Pages",
+        ).bind('page_count')
+        dynamic_filter = filters.Filter(
+            filters.InputLookup('gte', label='>='),
+            filters.ChoiceLookup('exact', label='is', choices=choices),
+            label="Pages",
+        ).bind('page_count')
+        filterset = mock.MagicMock()
+        filterset._meta.model._meta.get_field.return_value = field
+
+        # Target
+        context = {'filterset': filterset, 'filter': static_filter, 'queryset': None}
+        first = static_filter.get_options_schema_info(context)
+        second = static_filter.get_options_schema_info(context)
+
+        assert first == second
+        assert list(static_filter._options_schema_lookups) == [filterset._meta.model]
+        # Expect the memoized definitions not to be modified through the handed out schema
+        first['lookups']['exact']['label'] = 'HACKED'
+        first['lookups']['exact']['choices'].append((2, 'Two'))
+        assert static_filter.get_options_schema_info(context) == second
+
+        # Expect lookups with dynamic choices to be produced on each call
+        context = {'filterset': filterset, 'filter': dynamic_filter, 'queryset': None}
+        first = dynamic_filter.get_options_schema_info(context)
+        second = dynamic_filter.get_options_schema_info(context)
+
+        assert first == second
+        assert dynamic_filter._options_schema_lookups == {}
+        assert choices.call_count == 2
+
+    def test_get_options_schema_info__with_customized_choice_definition(self):
+        class CustomChoiceLookup(filters.ChoiceLookup):
+            __slots__ = ()
+
+            def get_options_schema_definition(self, field=None):
+                return {**super().get_options_schema_definition(field), 'extra': True}
+
+        lookup = CustomChoiceLookup('exact', label='is', choices=[(1, 'One')])
+
+        # Expect subclasses that customize the definition to be treated as dynamic
+        assert not lookup.has_static_options_schema_definition()
+        assert filters.ChoiceLookup('exact', label='is', choices=[(1, 'One')]).has_static_options_schema_definition()
+        assert filters.YesNoChoiceLookup().has_static_options_schema_definition()
+
+    def test_get_options_schema_info__with_help_text(self):
+        field = models.IntegerField(help_text="Number of printed pages")
+        filter = filters.Filter(filters.InputLookup('gte', label='>='), label="Pages")
+        filterset = mock.MagicMock()
+        filterset._meta.model._meta.get_field.return_value = field
+        filter = filter.bind('page_count')
+
+        # Target
+        context = {'filterset': filterset, 'filter': filter, 'queryset': None}
+        options_schema_info = filter.get_options_schema_info(context)
+
+        assert options_schema_info['help_text'] == "Number of printed pages"
+        # Expect the memoized help text to be reused
+        assert filter.get_options_schema_info(context)['help_text'] == "Number of printed pages"
+
+    def test_get_options_schema_info__with_blank_help_text(self):
+        field = models.IntegerField(help_text="")
+        filter = filters.Filter(filters.InputLookup('gte', label='>='), label="Pages")
+        filterset = mock.MagicMock()
+        filterset._meta.model._meta.get_field.return_value = field
+        filter = filter.bind('page_count')
+
+        # Target
+        context = {'filterset': filterset, 'filter': filter, 'queryset': None}
+        options_schema_info = filter.get_options_schema_info(context)
+
+        assert 'help_text' not in options_schema_info
+
     def test_get_options_schema_info__for_non_field_filter(self):
         filter_name = 'is_published'
         label = "Is published"
@@ -458,6 +662,73 @@ class TestFilter:
         }
         assert filter.transmute(criteria, context=context) == models.Q(pages__gte='50')
 
+    def test_clean(self):
+        filter = filters.Filter(
+            filters.InputLookup('exact', label='is'),
+            label="Type",
+            solvent_value='any',
+        )
+        filter = filter.bind(name='type')
+
+        # Expect unchanged criteria to be given back as is
+        criteria = {'lookup': 'exact', 'value': 'bulk'}
+        assert filter.clean(criteria) is criteria
+        # Expect the solvent value to be replaced without modifying the given criteria
+        criteria = {'lookup': 'exact', 'value': 'any'}
+        assert filter.clean(criteria) == {'lookup': 'exact', 'value': filters.STICKY_SOLVENT_VALUE}
+        assert criteria == {'lookup': 'exact', 'value': 'any'}
+
+    def test_clean__with_cleaning_lookup(self):
+        class UpperInputLookup(filters.InputLookup):
+            __slots__ = ()
+
+            def clean(self, value):
+                return value.upper()
+
+        filter = filters.Filter(UpperInputLookup('exact', label='is'), label="Type")
+        filter = filter.bind(name='type')
+        plain_filter = filters.Filter(filters.InputLookup('exact', label='is'), label="Type")
+        plain_filter = plain_filter.bind(name='type')
+        criteria = {'lookup': 'exact', 'value': 'bulk'}
+
+        # Target
+        assert filter.clean(criteria) == {'lookup': 'exact', 'value': 'BULK'}
+
+        # Expect the lookup's clean to be skipped when it doesn't change the value
+        with mock.patch.object(filters.InputLookup, 'clean') as clean:
+            assert plain_filter.clean(criteria) is criteria
+        assert not clean.called
+
+    def test_transmute__does_not_modify_criteria(self):
+        filter = filters.Filter(filters.InputLookup('exact', label='is'), label="Type")
+        filter = filter.bind(name='type')
+        criteria = {'value': 'bulk'}
+        context = {'filterset': None, 'filter': filter, 'queryset': None}
+
+        # Target
+        assert filter.transmute(criteria, context=context) == models.Q(type__exact='bulk')
+
+        assert criteria == {'value': 'bulk'}
+
+    def test_transmute__with_cleaned_value_and_no_lookup(self):
+        class UpperInputLookup(filters.InputLookup):
+            __slots__ = ()
+
+            def clean(self, value):
+                return value.upper()
+
+        transmuter = mock.Mock(return_value=models.Q(type='BULK'))
+        filter = filters.Filter(UpperInputLookup('exact', label='is'), label="Type", transmuter=transmuter)
+        filter = filter.bind(name='type')
+        criteria = {'value': 'bulk'}
+        context = {'filterset': None, 'filter': filter, 'queryset': None}
+
+        # Target
+        assert filter.transmute(criteria, context=context) == models.Q(type='BULK')
+
+        transmuter.assert_called_once_with({'value': 'BULK', 'lookup': 'exact'}, context=context)
+        assert criteria == {'value': 'bulk'}
+
     def test_valid_json_types(self):
         # TODO Expand this test to cover native json types: number, null, array, and object.
 
@@ -529,6 +800,73 @@ class TestStickyFilter:
         # Check the default Q argument
         assert filter.get_sticky_Q(context=context) == models.Q(type__exact=sticky_value)
 
+    def test_get_sticky_Q__is_memoized(self):
+        filter = filters.Filter(
+            filters.ChoiceLookup('exact', label='is', choices=[('manual', 'Manual'), ('bulk', 'Bulk')]),
+            label="Type",
+            sticky_value='manual',
+        )
+        filter = filter.bind(name='type')
+        context = {'filterset': None, 'filter': filter, 'queryset': None}
+
+        # Target
+        with mock.patch.object(filter, '_transmute_criteria', wraps=filter._transmute_criteria) as t:
+            sticky_q = filter.get_sticky_Q(context=context)
+            second_sticky_q = filter.get_sticky_Q(context=context)
+            assert t.call_count == 1
+
+        assert sticky_q == second_sticky_q == models.Q(type__exact='manual')
+        # Expect each caller to receive its own Q
+        assert second_sticky_q is not sticky_q
+        assert second_sticky_q.children is not sticky_q.children
+        # Expect a new binding to produce its own Q
+        other_filter = filter.bind(name='kind')
+        other_context = {'filterset': None, 'filter': other_filter, 'queryset': None}
+        assert other_filter.get_sticky_Q(context=other_context) == models.Q(kind__exact='manual')
+        # Expect the cache can be discarded
+        filter.clear_sticky_cache()
+        assert filter._sticky_Q is None
+        assert filter.get_sticky_Q(context=context) == sticky_q
+        assert filter._sticky_Q is not None
+
+    def test_get_sticky_Q__with_transmuter_is_not_memoized(self):
+        transmuter = mock.Mock(return_value=models.Q(type__in=['manual']))
+        filter = filters.Filter(
+            filters.ChoiceLookup('exact', label='is', choices=[('manual', 'Manual'), ('bulk', 'Bulk')]),
+            label="Type",
+            sticky_value='manual',
+            transmuter=transmuter,
+        )
+        filter = filter.bind(name='type')
+        context = {'filterset': None, 'filter': filter, 'queryset': None}
+
+        # Target
+        filter.get_sticky_Q(context=context)
+        filter.get_sticky_Q(context=context)
+
+        assert transmuter.call_count == 2
+
+    def test_get_sticky_Q__with_customized_clean_is_not_memoized(self):
+        class RelativeDateRangeLookup(filters.DateRangeLookup):
+            __slots__ = ()
+
+            def clean(self, value):
+                # Stands in for resolving a relative value (e.g. "last 30 days") to dates.
+                return [value, datetime.date.today().isoformat()]
+
+        lookup = RelativeDateRangeLookup(label='between')
+        filter = filters.Filter(lookup, label="Created", sticky_value='2025-01-01')
+        filter = filter.bind(name='created')
+        context = {'filterset': None, 'filter': filter, 'queryset': None}
+
+        # Target
+        sticky_q = filter.get_sticky_Q(context=context)
+
+        assert sticky_q == models.Q(created__range=['2025-01-01', datetime.date.today().isoformat()])
+        assert filter.get_sticky_Q(context=context) is not sticky_q
+        assert not lookup.has_static_transmute()
+        assert filters.DateRangeLookup(label='between').has_static_transmute()
+
 
 @pytest.mark.django_db
 class TestFilterWithDBAccess:
@@ -1,6 +1,8 @@
 import json
+from unittest import mock
 
 import pytest
+from jsonschema import ValidationError
 from jsonschema.protocols import Validator
 from model_bakery import baker
 
@@ -90,6 +92,32 @@ class TestJsonSchema:
         }
         assert schema['$defs']['sex-filter'] == expected_sex_filter
 
+    def test_schema_is_generated_once_per_class(self):
+        schema = JSONSchema(ParticipantFilterSet()).schema
+        other_schema = JSONSchema(ParticipantFilterSet()).schema
+
+        assert schema == other_schema
+        # Expect changes to one instance's schema not to affect the others or validation
+        schema['$id'] = 'https://example.com/participants.json'
+        assert other_schema['$id'] != schema['$id']
+        schema['$defs']['name-filter']['prefixItems'][1]['properties']['lookup']['enum'].append('BOGUS')
+        assert 'BOGUS' not in other_schema['$defs']['name-filter']['prefixItems'][1]['properties']['lookup']['enum']
+        assert not ParticipantFilterSet(["and", [["name", {"lookup": "BOGUS", "value": "har"}]]]).is_valid
+
+    def test_schema_is_reused_by_instance(self):
+        json_schema = JSONSchema(ParticipantFilterSet())
+        assert json_schema.schema is json_schema.schema
+
+    def test_validate(self):
+        json_schema = JSONSchema(ParticipantFilterSet())
+
+        # Expect the validator to be shared by the FilterSet class
+        assert json_schema.validator is JSONSchema(ParticipantFilterSet()).validator
+
+        json_schema.validate(["and", [["name", {"lookup": "icontains", "value": "har"}]]])
+        with pytest.raises(ValidationError):
+            json_schema.validate(["and", [["name", {"lookup": "exact", "value": "har"}]]])
+
     def test_to_json(self):
         filterset = ParticipantFilterSet()
         json_schema = JSONSchema(filterset)
@@ -97,6 +125,22 @@ class TestJsonSchema:
         assert json.dumps(json_schema.schema) == str(json_schema)
         assert json.loads(str(json_schema))
 
+    def test_to_json__is_serialized_once_per_class(self):
+        json_schema = JSONSchema(ParticipantFilterSet())
+
+        # Target
+        assert str(json_schema) is str(JSONSchema(ParticipantFilterSet()))
+
+        # Expect changes to the instance's schema to be serialized
+        json_schema.schema['$id'] = 'https://example.com/participants.json'
+        assert json.loads(str(json_schema))['$id'] == 'https://example.com/participants.json'
+
+        # Expect nested changes to the instance's schema to be serialized
+        json_schema = JSONSchema(ParticipantFilterSet())
+        json_schema.schema['$defs']['name-filter']['prefixItems'][0]['const'] = 'renamed'
+        assert json.loads(str(json_schema))['$defs']['name-filter']['prefixItems'][0]['const'] == 'renamed'
+        assert 'renamed' not in str(JSONSchema(ParticipantFilterSet()))
+
 
 class TestFilteringOptionsSchema:
     def test_generation_of_schema(self):
@@ -242,6 +286,17 @@ class TestFilteringOptionsSchema:
         assert schema.schema['filters']['category'] == expected_filters['category']
         assert schema.schema['filters']['brand'] == expected_filters['brand']
 
+    def test_schema_is_evaluated_on_first_access(self):
+        filterset = TopBrandKitchenProductFilterSet()
+        schema = FilteringOptionsSchema(filterset)
+
+        get_sticky_Q = filters.Filter.get_sticky_Q
+        with mock.patch.object(filters.Filter, 'get_sticky_Q', autospec=True, side_effect=get_sticky_Q) as mocked:
+            assert mocked.call_count == 0
+            assert schema.schema['filters']['brand']['is_sticky']
+            assert schema.schema['filters']['category']['is_sticky']
+            assert mocked.call_count == 2
+
     def test_to_json(self):
         filterset = ParticipantFilterSet()
         schema = FilteringOptionsSchema(filterset)
@@ -249,6 +304,15 @@ class TestFilteringOptionsSchema:
         assert json.dumps(schema.schema) == str(schema)
         assert json.loads(str(schema))
 
+    def test_iter_json(self):
+        filterset = TopBrandKitchenProductFilterSet()
+        schema = FilteringOptionsSchema(filterset)
+
+        chunks = list(schema.iter_json())
+        # Expect a chunk per filter with opening and closing chunks
+        assert len(chunks) == len(filterset.filters) + 2
+        assert ''.join(chunks) == str(schema)
+
     @pytest.mark.django_db
     def test_with_foreign_relation_field(self):
         participants = [baker.make(models.Participant) for i in range(0, 4)]
@@ -1,7 +1,10 @@
+import enum
+
 from django.db.models import Q
 
 from django_filtering.utils import (
     construct_field_lookup_arg,
+    construct_field_lookup_name,
     deconstruct_query,
     merge_dicts,
 )
@@ -13,6 +16,12 @@ def test_merge_dicts():
     assert merge_dicts(*merging) == expected
 
 
+def test_merge_dicts__does_not_modify_args():
+    merging = [{'a': 1}, {'b': 2}, {'a': 3}]
+    assert merge_dicts(*merging) == {'a': 3, 'b': 2}
+    assert merging == [{'a': 1}, {'b': 2}, {'a': 3}]
+
+
 def test_merge_dicts__with_one_arg():
     expected = merging = [{'a': 1, 'z': 1}]
     expected = {'a': 1, 'z': 1}
@@ -25,12 +34,32 @@ def test_merge_dicts__with_no_args():
     assert merge_dicts(*merging) == expected
 
 
+def test_construct_field_lookup_name():
+    assert construct_field_lookup_name('state') == 'state'
+    assert construct_field_lookup_name('name', 'icontains') == 'name__icontains'
+    assert construct_field_lookup_name('stocked_on', ['year', 'gte']) == 'stocked_on__year__gte'
+    assert construct_field_lookup_name('stocked_on', ('year', 'gte')) == 'stocked_on__year__gte'
+    assert construct_field_lookup_name('state', []) == 'state'
+
+    class Lookup(str, enum.Enum):
+        GTE = 'gte'
+
+    assert construct_field_lookup_name('age', Lookup.GTE) == 'age__gte'
+    assert type(construct_field_lookup_name('age', Lookup.GTE)) is str
+    # Expect the same name object to be reused
+    assert construct_field_lookup_name('name', 'icontains') is construct_field_lookup_name('name', 'icontains')
+
+
 def test_construct_field_lookup_arg():
     assert construct_field_lookup_arg('state', 'Complete') == ('state', 'Complete')
     assert construct_field_lookup_arg('name', 'foo', 'icontains') == (
         'name__icontains',
         'foo',
     )
+    assert construct_field_lookup_arg('stocked_on', '2024', ['year', 'gte']) == (
+        'stocked_on__year__gte',
+        '2024',
+    )
 
 
 def test_deconstruct_query():
@@ -41,3 +70,15 @@ def test_deconstruct_query():
 
     expected = ['name', {'lookup': 'icontains', 'value': 'foo'}]
     assert deconstruct_query(Q(name__icontains='foo')) == expected
+
+    expected = ['stocked_on', {'lookup': 'year__gte', 'value': 2024}]
+    assert deconstruct_query(Q(stocked_on__year__gte=2024)) == expected
+
+
+def test_deconstruct_query__returns_new_query_data():
+    q = Q(name__icontains='foo')
+    query_data = deconstruct_query(q)
+    query_data[1]['value'] = 'bar'
+
+    # Expect changes to the result not to affect later deconstructions
+    assert deconstruct_query(q) == ['name', {'lookup': 'icontains', 'value': 'foo'}]